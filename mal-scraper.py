@@ -1,175 +1,439 @@
 import argparse
+import asyncio
 import logging
-import time
-from dataclasses import dataclass
-from typing import Dict, List
+import math
+import random
+import sys
+from typing import AsyncIterator, Dict, List
 
+import aiohttp
+import orjson
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 import pandas as pd
-import requests
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.jikan.moe/v4"
 GENRE_ISEKAI = 62
-RATE_LIMIT_DELAY = 2  # Delay in seconds to manage API rate limits
+REQUESTS_PER_SECOND = 3  # Jikan allows roughly 3 requests per second
+REQUESTS_PER_MINUTE = 60  # Jikan's per-minute quota, used as the burst budget
+REQUEST_TIMEOUT = 30  # Timeout in seconds for each API request
+MAX_RETRIES = 5  # Attempts per request before giving up
+MAX_BACKOFF = 60  # Upper bound in seconds for retry delays
 
+CACHE_FILE = "jikan_cache.sqlite"
+DEFAULT_CACHE_TTL = 86400  # Anime data can change while a series airs
+CHARACTER_CACHE_TTL = 7 * 86400  # Character details rarely change
 
-def fetch_data(url: str, params: Dict = None) -> Dict:
-    """Fetch data from the given URL with specified parameters."""
+
+class RateLimiter:
+    """Token-bucket rate limiter.
+
+    The bucket holds up to `requests_per_minute` tokens and refills at
+    `requests_per_second`, so concurrent tasks can burst up to the minute
+    budget while the long-run rate stays within Jikan's quota.
+    """
+
+    # Adaptive-rate parameters: additive increase on success, multiplicative
+    # decrease on 429, clamped between the floor and the configured ceiling.
+    RATE_INCREMENT = 0.05
+    RATE_BACKOFF = 0.5
+    MIN_RATE = 0.5
+
+    def __init__(self, requests_per_second: float = REQUESTS_PER_SECOND, requests_per_minute: int = REQUESTS_PER_MINUTE):
+        self.rate = float(requests_per_second)
+        self.max_rate = float(requests_per_second)
+        self.capacity = float(requests_per_minute)
+        self.tokens = float(requests_per_minute)
+        self.last = None
+        self._lock = asyncio.Lock()
+
+    def increase_rate(self):
+        self.rate = min(self.max_rate, self.rate + self.RATE_INCREMENT)
+
+    def decrease_rate(self):
+        self.rate = max(self.MIN_RATE, self.rate * self.RATE_BACKOFF)
+
+    def refund(self):
+        # Cache hits never reach the network, so return the token wait() took.
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self.last is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.last = asyncio.get_running_loop().time()
+                self.tokens = 0.0
+            else:
+                self.tokens -= 1
+
+
+def _retry_after(response: aiohttp.ClientResponse, fallback: float) -> float:
+    """Read Retry-After as seconds, falling back when absent or an HTTP-date."""
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        time.sleep(RATE_LIMIT_DELAY)
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Request failed: {e}")
+        return float(response.headers.get("Retry-After", fallback))
+    except ValueError:
+        return fallback
+
+
+class JikanAPI:
+    """Async client for the Jikan API with a shared session, rate limiting, caching and retries."""
+
+    def __init__(self):
+        self._session = None
+        # Shared by all in-flight requests so concurrent fetches stay within
+        # Jikan's rate limit instead of sleeping between calls.
+        self.rate_limiter = RateLimiter()
+        # Hard cap on simultaneous requests, backing up the connector limits
+        # so high fan-out can't exhaust sockets or file descriptors.
+        self._conn_sem = asyncio.Semaphore(10)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the client can be built outside the event loop.
+        if self._session is None or self._session.closed:
+            # Hold keep-alive sockets for the whole scrape and cache DNS lookups
+            # so every request after the first reuses a warm connection.
+            connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=60, ttl_dns_cache=300)
+            # Cache at the HTTP layer: responses are stored with their headers,
+            # Cache-Control/ETag revalidation is honoured when Jikan sends them,
+            # and the TTLs below act as the fallback expiry.
+            cache = SQLiteBackend(
+                cache_name=CACHE_FILE,
+                expire_after=DEFAULT_CACHE_TTL,
+                urls_expire_after={f"{BASE_URL}/characters/*": CHARACTER_CACHE_TTL},
+                cache_control=True,
+            )
+            self._session = CachedSession(cache=cache, connector=connector, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def get(self, endpoint: str, params: Dict = None) -> Dict:
+        """Fetch data from the given endpoint, retrying transient failures with exponential backoff."""
+        url = f"{BASE_URL}{endpoint}"
+        session = self._ensure_session()
+        for attempt in range(MAX_RETRIES):
+            # One jittered exponential delay per attempt; a 429's Retry-After
+            # hint overrides it below.
+            delay = min(MAX_BACKOFF, 2 ** attempt * (0.5 + random.random()))
+            try:
+                await self.rate_limiter.wait()
+                async with self._conn_sem:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 429:
+                            self.rate_limiter.decrease_rate()
+                            delay = min(MAX_BACKOFF, _retry_after(response, delay))
+                            logger.warning("Rate limited on %s; retrying in %.1fs", url, delay)
+                        else:
+                            response.raise_for_status()
+                            if response.from_cache:
+                                # No request hit the network; give the token back.
+                                self.rate_limiter.refund()
+                            else:
+                                if response.headers.get("X-RateLimit-Remaining") == "0":
+                                    await asyncio.sleep(_retry_after(response, 1))
+                                self.rate_limiter.increase_rate()
+                            return orjson.loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("Request failed: %s; retrying in %.1fs", e, delay)
+            # Sleep outside the connection slot so waiting retries don't hold
+            # it; the final attempt has no retry to wait for.
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(delay)
+        logger.error("Request failed after %d attempts: %s", MAX_RETRIES, url)
         return {}
 
 
-def build_jikan_url(endpoint: str, **params) -> str:
-    """Construct a URL for the Jikan API with given endpoint and parameters."""
-    return f"{BASE_URL}/{endpoint}?{'&'.join(f'{key}={value}' for key, value in params.items())}"
-
-
-@dataclass
-class Anime:
-    anime_id: int
-    title: str
-    title_english: str = ""
-    title_japanese: str = ""
-    title_synonyms: str = ""
-    url: str = ""
-    image_url: str = ""
-    trailer_url: str = ""
-    type: str = ""
-    source: str = ""
-    episodes: int = 0
-    status: str = ""
-    airing: bool = False
-    aired_from: str = ""
-    aired_to: str = ""
-    duration: str = ""
-    rating: str = ""
-    score: float = 0.0
-    scored_by: int = 0
-    rank: int = 0
-    popularity: int = 0
-    members: int = 0
-    favorites: int = 0
-    synopsis: str = ""
-    background: str = ""
-    season: str = ""
-    year: int = 0
-    broadcast_day: str = ""
-    broadcast_time: str = ""
-    producers: str = ""
-    licensors: str = ""
-    studios: str = ""
-    genres: str = ""
-    themes: str = ""
-
-    @classmethod
-    def from_api_response(cls, data: Dict):
-        return cls(
-            anime_id=data.get("mal_id"),
-            title=data.get("title"),
-            title_english=data.get("title_english"),
-            title_japanese=data.get("title_japanese"),
-            title_synonyms=", ".join(data.get("title_synonyms", [])),
-            url=data.get("url"),
-            image_url=data.get("images", {}).get("jpg", {}).get("image_url"),
-            trailer_url=data.get("trailer", {}).get("url"),
-            type=data.get("type"),
-            source=data.get("source"),
-            episodes=data.get("episodes"),
-            status=data.get("status"),
-            airing=data.get("airing"),
-            aired_from=data.get("aired", {}).get("from"),
-            aired_to=data.get("aired", {}).get("to"),
-            duration=data.get("duration"),
-            rating=data.get("rating"),
-            score=data.get("score"),
-            scored_by=data.get("scored_by"),
-            rank=data.get("rank"),
-            popularity=data.get("popularity"),
-            members=data.get("members"),
-            favorites=data.get("favorites"),
-            synopsis=data.get("synopsis"),
-            background=data.get("background"),
-            season=data.get("season"),
-            year=data.get("year"),
-            broadcast_day=data.get("broadcast", {}).get("day"),
-            broadcast_time=data.get("broadcast", {}).get("time"),
-            producers=", ".join([producer["name"] for producer in data.get("producers", [])]),
-            licensors=", ".join([licensor["name"] for licensor in data.get("licensors", [])]),
-            studios=", ".join([studio["name"] for studio in data.get("studios", [])]),
-            genres=", ".join([genre["name"] for genre in data.get("genres", [])]),
-            themes=", ".join([theme["name"] for theme in data.get("themes", [])]),
-        )
-
-
-@dataclass
-class Character:
-    character_id: int
-    anime_id: int
-    name: str
-    name_kanji: str = ""
-    nicknames: str = ""
-    url: str = ""
-    image_url: str = ""
-    favorites: int = 0
-    about: str = ""
-    role: str = ""
-    voice_actor_name: str = ""
-    voice_actor_lang: str = ""
-    voice_actor_image_url: str = ""
-
-    @classmethod
-    def from_api_response(cls, character: Dict, anime_id: int, full_details: Dict):
-        return cls(
-            character_id=character["character"]["mal_id"],
-            anime_id=anime_id,
-            name=character["character"]["name"],
-            name_kanji=full_details.get("name_kanji"),
-            nicknames=", ".join(full_details.get("nicknames", [])),
-            url=character["character"].get("url"),
-            image_url=character["character"].get("images", {}).get("jpg", {}).get("image_url"),
-            favorites=full_details.get("favorites"),
-            about=full_details.get("about"),
-            role=character.get("role"),
-            voice_actor_name=", ".join([va["person"]["name"] for va in character.get("voice_actors", [])]),
-            voice_actor_lang=", ".join([va["language"] for va in character.get("voice_actors", [])]),
-            voice_actor_image_url=", ".join([va["person"]["images"]["jpg"]["image_url"] for va in character.get("voice_actors", [])])
-        )
-
-
-def get_anime_list(limit: int) -> List[Anime]:
-    """Fetches a list of isekai anime from the Jikan API and returns a list of Anime objects."""
-    anime_list = []
-    page = 1
-    while len(anime_list) < limit:
-        data = fetch_data(build_jikan_url("anime", genres=GENRE_ISEKAI, page=page, limit=min(limit - len(anime_list), 25)))
-        if 'data' in data:
-            for anime_data in data['data']:
-                anime_list.append(Anime.from_api_response(anime_data))
-            logging.info(f"Fetched {len(data['data'])} anime from page {page}")
-            page += 1
+def _walk(item, keys):
+    for key in keys:
+        item = item[key]
+    return item
+
+
+def _join(items: List, *keys: str) -> str:
+    """Comma-join a (possibly nested) field from each item, returning '' for empty input."""
+    # A list comprehension here beats a generator: str.join sizes its result
+    # from the list in one pass instead of pumping a generator frame per item.
+    return ", ".join([_walk(item, keys) for item in items]) if items else ""
+
+
+def _intern(value):
+    """Intern low-cardinality strings so repeated values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _dig(data: Dict, *keys: str):
+    """Walk nested keys, returning None as soon as a level is missing."""
+    for key in keys:
+        if not data:
+            return None
+        data = data.get(key)
+    return data
+
+
+def parse_anime_details(data: Dict) -> Dict:
+    """Flatten a raw anime payload from the API into a row dict."""
+    return {
+        "anime_id": data.get("mal_id"),
+        "title": data.get("title"),
+        "title_english": data.get("title_english"),
+        "title_japanese": data.get("title_japanese"),
+        "title_synonyms": _join(data.get("title_synonyms")),
+        "url": data.get("url"),
+        "image_url": _dig(data, "images", "jpg", "image_url"),
+        "trailer_url": _dig(data, "trailer", "url"),
+        "type": _intern(data.get("type")),
+        "source": _intern(data.get("source")),
+        "episodes": data.get("episodes"),
+        "status": _intern(data.get("status")),
+        "airing": data.get("airing"),
+        "aired_from": _dig(data, "aired", "from"),
+        "aired_to": _dig(data, "aired", "to"),
+        "duration": data.get("duration"),
+        "rating": _intern(data.get("rating")),
+        "score": data.get("score"),
+        "scored_by": data.get("scored_by"),
+        "rank": data.get("rank"),
+        "popularity": data.get("popularity"),
+        "members": data.get("members"),
+        "favorites": data.get("favorites"),
+        "synopsis": data.get("synopsis"),
+        "background": data.get("background"),
+        "season": _intern(data.get("season")),
+        "year": data.get("year"),
+        "broadcast_day": _intern(_dig(data, "broadcast", "day")),
+        "broadcast_time": _dig(data, "broadcast", "time"),
+        "producers": _join(data.get("producers"), "name"),
+        "licensors": _join(data.get("licensors"), "name"),
+        "studios": _join(data.get("studios"), "name"),
+        "genres": _join(data.get("genres"), "name"),
+        "themes": _join(data.get("themes"), "name"),
+    }
+
+
+def parse_character_details(character: Dict, anime_id: int, full_details: Dict) -> Dict:
+    """Flatten a raw character entry and its detail payload into a row dict."""
+    basic = character.get("character", {})
+    voice_actors = character.get("voice_actors")
+    return {
+        "character_id": basic.get("mal_id"),
+        "anime_id": anime_id,
+        "name": basic.get("name"),
+        "name_kanji": full_details.get("name_kanji"),
+        "nicknames": _join(full_details.get("nicknames")),
+        "url": basic.get("url"),
+        "image_url": _dig(basic, "images", "jpg", "image_url"),
+        "favorites": full_details.get("favorites"),
+        "about": full_details.get("about"),
+        "role": _intern(character.get("role")),
+        "voice_actor_name": _join(voice_actors, "person", "name"),
+        "voice_actor_lang": _intern(_join(voice_actors, "language")),
+        "voice_actor_image_url": _join(voice_actors, "person", "images", "jpg", "image_url"),
+    }
+
+
+ANIME_FIELDS = list(parse_anime_details({}).keys())
+CHARACTER_FIELDS = list(parse_character_details({}, None, {}).keys())
+
+# Count-like fields stored as nullable Int32 instead of object/float64-with-NaN.
+INT_FIELDS = {"anime_id", "episodes", "scored_by", "rank", "popularity", "members", "favorites", "year", "character_id"}
+
+
+def _arrow_schema(field_names: List[str]) -> pa.Schema:
+    """Explicit Arrow schema so per-batch type inference can't drift between pages."""
+    types = {}
+    for name in field_names:
+        if name in INT_FIELDS:
+            types[name] = pa.int32()
+        elif name == "airing":
+            types[name] = pa.bool_()
+        elif name == "score":
+            types[name] = pa.float64()
         else:
-            break
-    return anime_list
+            types[name] = pa.string()
+    return pa.schema(types.items())
+
+
+ANIME_SCHEMA = _arrow_schema(ANIME_FIELDS)
+
+
+def to_columns(records: List[Dict], field_names: List[str]) -> Dict[str, List]:
+    """Transpose row dicts into a dict of column lists so pandas builds each column in one pass."""
+    columns = {name: [] for name in field_names}
+    for record in records:
+        for name in field_names:
+            columns[name].append(record[name])
+    return columns
+
 
+def to_dataframe(records: List[Dict], field_names: List[str]) -> pd.DataFrame:
+    """Build a DataFrame from row dicts, dropping all-None columns and downcasting counts."""
+    columns = to_columns(records, field_names)
+    columns = {name: values for name, values in columns.items() if any(value is not None for value in values)}
+    for name in INT_FIELDS & columns.keys():
+        columns[name] = pd.array(columns[name], dtype="Int32")
+    return pd.DataFrame(columns)
 
-def get_anime_characters(anime_id: int, character_limit: int) -> List[Character]:
-    """Fetches characters for a specific anime from the Jikan API and returns a list of Character objects."""
-    character_list = []
-    data = fetch_data(f"{BASE_URL}/anime/{anime_id}/characters")
-    if 'data' in data:
-        characters = data['data'][:character_limit]
-        logging.info(f"Fetched {len(characters)}/{character_limit} characters for anime ID {anime_id}")
-        for character in characters:
-            full_details = fetch_data(f"{BASE_URL}/characters/{character['character']['mal_id']}").get('data', {})
-            character_list.append(Character.from_api_response(character, anime_id, full_details))
-    return character_list
+
+def save_records(records: List[Dict], field_names: List[str], filename: str, output_format: str):
+    """Save records in the requested output format."""
+    if output_format == "csv":
+        # pyarrow's multithreaded CSV writer avoids pandas' per-cell Python loop.
+        # A 1 MiB buffer batches the writer's output into few large syscalls.
+        table = pa.Table.from_pydict(to_columns(records, field_names))
+        with open(filename, "wb", buffering=1 << 20) as f:
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=True))
+    elif output_format == "feather":
+        to_dataframe(records, field_names).to_feather(filename, compression="zstd")
+    else:
+        to_dataframe(records, field_names).to_parquet(filename, index=False)
+    logger.info("Data saved to %s", filename)
+
+
+class IsekaiAnimeScraper:
+    """Coordinates fetching isekai anime and character data and saving the datasets."""
+
+    def __init__(self, args):
+        self.args = args
+        self.api = JikanAPI()
+        # Caps how many character-detail fetches run() keeps in flight at once;
+        # without it, a large --limit spawns one coroutine per character.
+        self._detail_sem = asyncio.Semaphore(10)
+        # Popular characters show up in several anime's cast lists; remember
+        # the fetch task per id so each is requested at most once per run.
+        self._character_details: Dict[int, asyncio.Task] = {}
+
+    async def fetch_isekai_anime(self) -> AsyncIterator[Dict]:
+        """Fetches isekai anime, yielding one parsed row dict at a time."""
+        limit = self.args.limit
+        params = {"genres": GENRE_ISEKAI, "limit": 25}
+        pages = [await self.api.get("/anime", params={**params, "page": 1})]
+        # Page 1 reports how many pages exist, so never request past the end.
+        last_visible_page = _dig(pages[0], "pagination", "last_visible_page") or 1
+        num_pages = min(math.ceil(limit / 25), last_visible_page)
+        if num_pages > 1:
+            # The remaining pages are independent, so fetch them all in flight at once.
+            pages.extend(await asyncio.gather(
+                *[self.api.get("/anime", params={**params, "page": page}) for page in range(2, num_pages + 1)]
+            ))
+        fetched = 0
+        for page_number, data in enumerate(pages, start=1):
+            page_data = data.get('data', [])
+            if not page_data:
+                break
+            for anime_data in page_data[:limit - fetched]:
+                yield parse_anime_details(anime_data)
+            fetched = min(limit, fetched + len(page_data))
+            logger.info("Fetched %d anime from page %d", len(page_data), page_number)
+
+    async def fetch_character_details(self, character_id: int) -> Dict:
+        """Fetches the full detail payload for a single character, memoized per run.
+
+        The memo holds the fetch task rather than its result, so concurrent
+        lookups of a character shared across cast lists all await the same
+        in-flight request instead of each issuing their own.
+        """
+        if character_id not in self._character_details:
+            self._character_details[character_id] = asyncio.create_task(self.api.get(f"/characters/{character_id}"))
+        details = await self._character_details[character_id]
+        return details.get('data', {})
+
+    async def fetch_anime_characters(self, anime_id: int) -> List[Dict]:
+        """Fetches characters for a specific anime and returns a list of parsed row dicts.
+
+        The anime's character list already carries most fields; --deep_characters
+        adds one /characters/{id} request per character for name_kanji,
+        nicknames, favorites and about.
+        """
+        character_list = []
+
+        async def fetch_one(character: Dict) -> Dict:
+            async with self._detail_sem:
+                details = await self.fetch_character_details(character['character']['mal_id'])
+            # Parse immediately so the raw detail payload can be collected right away.
+            return parse_character_details(character, anime_id, details)
+
+        data = await self.api.get(f"/anime/{anime_id}/characters")
+        if 'data' in data:
+            characters = data['data'][:self.args.character_limit]
+            logger.info("Fetched %d/%d characters for anime ID %d", len(characters), self.args.character_limit, anime_id)
+            if self.args.deep_characters:
+                character_list.extend(await asyncio.gather(*[fetch_one(character) for character in characters]))
+            else:
+                character_list.extend(parse_character_details(character, anime_id, {}) for character in characters)
+        return character_list
+
+    async def process_anime_data(self, anime_iter: AsyncIterator[Dict]):
+        """Consume the anime stream and save it.
+
+        csv output is written in page-sized batches as rows arrive, so only
+        one page is held in memory and the first bytes hit disk before
+        pagination finishes; feather/parquet materialize first since their
+        writers need the whole table.
+        """
+        if self.args.format != "csv":
+            anime_list = [anime async for anime in anime_iter]
+            await asyncio.to_thread(save_records, anime_list, ANIME_FIELDS, self.args.anime_file, self.args.format)
+            return
+        batch = []
+        with open(self.args.anime_file, "wb", buffering=1 << 20) as f:
+            with pacsv.CSVWriter(f, ANIME_SCHEMA) as writer:
+
+                async def flush(rows: List[Dict]):
+                    # Off-loop so in-flight requests keep progressing while a page flushes.
+                    table = pa.Table.from_pydict(to_columns(rows, ANIME_FIELDS), schema=ANIME_SCHEMA)
+                    await asyncio.to_thread(writer.write_table, table)
+
+                async for anime in anime_iter:
+                    batch.append(anime)
+                    if len(batch) >= 25:
+                        await flush(batch)
+                        batch = []
+                if batch:
+                    await flush(batch)
+        logger.info("Data saved to %s", self.args.anime_file)
+
+    async def process_character_data(self, character_list: List[Dict]):
+        await asyncio.to_thread(save_records, character_list, CHARACTER_FIELDS, self.args.character_file, self.args.format)
+
+    async def run(self):
+        try:
+            character_tasks = []
+
+            async def stream() -> AsyncIterator[Dict]:
+                # Kick off each anime's character fetches as soon as its row
+                # arrives, so they run while the rest of the list is still
+                # being paged in and while the anime output is written.
+                async for anime in self.fetch_isekai_anime():
+                    if self.args.characters:
+                        character_tasks.append(asyncio.create_task(self.fetch_anime_characters(anime["anime_id"])))
+                    yield anime
+
+            await self.process_anime_data(stream())
+
+            if self.args.characters:
+                character_list = []
+                for task in asyncio.as_completed(character_tasks):
+                    character_list.extend(await task)
+                await self.process_character_data(character_list)
+        finally:
+            await self.api.close()
 
 
 def main():
@@ -177,22 +441,16 @@ def main():
     parser.add_argument("-l", "--limit", type=int, default=10, help="Limit the number of anime to fetch.")
     parser.add_argument("-c", "--characters", action="store_true", help="Include character details in the dataset.")
     parser.add_argument("-cl", "--character_limit", type=int, default=10, help="Limit the number of characters to fetch per anime.")
-    parser.add_argument("-a", "--anime_file", type=str, default="anime.csv", help="Filename for saving anime data.")
-    parser.add_argument("-ch", "--character_file", type=str, default="characters.csv", help="Filename for saving character data.")
+    parser.add_argument("-dc", "--deep_characters", action="store_true", help="Fetch full character details (name_kanji, nicknames, favorites, about) at one extra request per character.")
+    parser.add_argument("-f", "--format", type=str, choices=["feather", "parquet", "csv"], default="feather", help="Output file format.")
+    parser.add_argument("-a", "--anime_file", type=str, default=None, help="Filename for saving anime data.")
+    parser.add_argument("-ch", "--character_file", type=str, default=None, help="Filename for saving character data.")
     args = parser.parse_args()
 
-    anime_list = get_anime_list(args.limit)
-    anime_df = pd.DataFrame([anime.__dict__ for anime in anime_list])
-    anime_df.to_csv(args.anime_file, index=False, encoding='utf-8')
-    logging.info(f"Anime data saved to {args.anime_file}")
+    args.anime_file = args.anime_file or f"anime.{args.format}"
+    args.character_file = args.character_file or f"characters.{args.format}"
 
-    if args.characters:
-        character_list = []
-        for anime in anime_list:
-            character_list.extend(get_anime_characters(anime.anime_id, args.character_limit))
-        character_df = pd.DataFrame([character.__dict__ for character in character_list])
-        character_df.to_csv(args.character_file, index=False, encoding='utf-8')
-        logging.info(f"Character data saved to {args.character_file}")
+    asyncio.run(IsekaiAnimeScraper(args).run())
 
 
 if __name__ == "__main__":